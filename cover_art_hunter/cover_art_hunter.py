@@ -1,83 +1,380 @@
 import argparse
 import asyncio
-import json
 import logging
 import os
+import struct
+import sys
+from contextlib import suppress
 from datetime import datetime
+from itertools import chain
+from operator import itemgetter
 from io import BytesIO
-from typing import Any, Dict, List, Optional, Tuple
+from tempfile import SpooledTemporaryFile
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
 
+import aiofiles
+import aiofiles.os
 import aiohttp
+import orjson
 from PIL import Image
 from prompt_toolkit import prompt
 from rag_kit.logging import setup_logger
-from tenacity import RetryError, retry, stop_after_attempt, wait_exponential
-from tqdm.asyncio import tqdm
+from tqdm import tqdm
+
+CHUNK_SIZE = 64 * 1024
+SPOOL_MAX_SIZE = 256 * 1024
+HEADER_PROBE_SIZE = 256 * 1024
+DIMENSIONS_CACHE_FILENAME = "dimensions_cache.json"
+CAA_CACHE_DIRNAME = "caa_cache"
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# SOFn markers, excluding DHT (C4), JPG (C8) and DAC (CC).
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+MAX_ATTEMPTS = 5
+MAX_RETRY_DELAY = 60
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+TRANSIENT_ERRORS = (
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+    asyncio.TimeoutError,
+)
+
+
+class RateLimiter:
+    """Async limiter spacing acquisitions evenly at `rate` per `period` seconds."""
+
+    def __init__(self, rate: float, period: float = 1.0) -> None:
+        self._interval = period / rate
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> None:
+        # Waiters queue on the lock, so a caller cancelled while waiting gives
+        # up its slot instead of wasting it.
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            delay = self._next_slot - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_slot = loop.time() + self._interval
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
 
 
-@retry(
-    stop=stop_after_attempt(5),
-    wait=wait_exponential(multiplier=1, min=1, max=60),
-    reraise=True,
+# Cover Art Archive image URLs are plain http, so resolve port 80 for it too.
+PRERESOLVED_HOSTS = (
+    ("musicbrainz.org", 443),
+    ("coverartarchive.org", 443),
+    ("coverartarchive.org", 80),
+    ("archive.org", 443),
 )
+
+# Connections the client keeps open to any single host.
+CONNECTIONS_PER_HOST = 5
+
+MUSICBRAINZ_SEMAPHORE = asyncio.Semaphore(5)
+COVER_ART_ARCHIVE_SEMAPHORE = asyncio.Semaphore(5)
+# Bounds in-flight image downloads (and the disk writes they stream into). Kept
+# at the connector's per-host limit so no download holds a slot while it is only
+# waiting for a connection.
+IMAGE_DOWNLOAD_SEMAPHORE = asyncio.Semaphore(CONNECTIONS_PER_HOST)
+
+# MusicBrainz allows 1 request per second per client.
+MUSICBRAINZ_RATE_LIMITER = RateLimiter(1)
+COVER_ART_ARCHIVE_RATE_LIMITER = RateLimiter(10)
+
+# Front cover URLs by release ID, shared across every album processed in a run.
+COVER_ART_URL_CACHE: Dict[str, List[str]] = {}
+
+
+def is_musicbrainz(url: str) -> bool:
+    return urlsplit(url).hostname == "musicbrainz.org"
+
+
+def host_semaphore(url: str) -> asyncio.Semaphore:
+    if is_musicbrainz(url):
+        return MUSICBRAINZ_SEMAPHORE
+    return COVER_ART_ARCHIVE_SEMAPHORE
+
+
+def host_rate_limiter(url: str) -> RateLimiter:
+    if is_musicbrainz(url):
+        return MUSICBRAINZ_RATE_LIMITER
+    return COVER_ART_ARCHIVE_RATE_LIMITER
+
+
+def retry_delay(attempt: int, response: aiohttp.ClientResponse = None) -> float:
+    # Honour Retry-After (in seconds) on 429/503, otherwise back off exponentially.
+    retry_after = response.headers.get("Retry-After", "") if response else ""
+    if retry_after.isdigit():
+        return min(MAX_RETRY_DELAY, int(retry_after))
+    return min(MAX_RETRY_DELAY, 2**attempt)
+
+
+def file_signature(entry: os.DirEntry) -> Tuple[int, int]:
+    stat = entry.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def scan_directory(path: str) -> Dict[str, Tuple[int, int]]:
+    # Map file names to (size, mtime_ns) so cached dimensions can be validated.
+    with os.scandir(path) as entries:
+        return {
+            entry.name: file_signature(entry) for entry in entries if entry.is_file()
+        }
+
+
+def lookup_cached_dimensions(
+    cache: Dict[str, Dict[str, Any]],
+    filename: str,
+    signature: Optional[Tuple[int, int]],
+) -> Optional[List[int]]:
+    # Entries only count if the file on disk is unchanged since they were stored.
+    entry = cache.get(filename)
+    if isinstance(entry, dict) and signature == (
+        entry.get("size"),
+        entry.get("mtime_ns"),
+    ):
+        return entry.get("dimensions")
+    return None
+
+
+def load_dimensions_cache(save_path: str) -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(os.path.join(save_path, DIMENSIONS_CACHE_FILENAME), "rb") as file:
+            return orjson.loads(file.read())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return {}
+
+
+def save_dimensions_cache(save_path: str, cache: Dict[str, Dict[str, Any]]) -> None:
+    with open(os.path.join(save_path, DIMENSIONS_CACHE_FILENAME), "wb") as file:
+        file.write(orjson.dumps(cache))
+
+
+def read_dimensions(source: Union[str, BinaryIO]) -> Tuple[int, int]:
+    # Image.open only parses the header; never touch pixel data here.
+    with Image.open(source) as image:
+        return image.size
+
+
+def parse_header_dimensions(file: BinaryIO) -> Optional[Tuple[int, int]]:
+    # Anything unexpected returns None so the caller falls back to Pillow.
+    head = file.read(24)
+    if head.startswith(PNG_SIGNATURE):
+        if len(head) < 24 or head[12:16] != b"IHDR":
+            return None
+        width, height = struct.unpack(">II", head[16:24])
+        return (width, height) if width and height else None
+    if not head.startswith(b"\xff\xd8"):
+        return None
+
+    # Walk the JPEG segments until the start-of-frame header.
+    file.seek(2)
+    while file.read(1) == b"\xff":
+        marker = file.read(1)
+        while marker == b"\xff":
+            marker = file.read(1)
+        if not marker or marker[0] == 0xD9:
+            return None
+        if marker[0] in JPEG_SOF_MARKERS:
+            frame = file.read(7)
+            if len(frame) < 7:
+                return None
+            height, width = struct.unpack(">HH", frame[3:7])
+            return (width, height) if width and height else None
+        if 0xD0 <= marker[0] <= 0xD8 or marker[0] == 0x01:
+            continue
+        length = file.read(2)
+        if len(length) < 2:
+            return None
+        # A segment length below 2 would seek backwards and loop forever.
+        (segment_length,) = struct.unpack(">H", length)
+        if segment_length < 2:
+            return None
+        file.seek(segment_length - 2, os.SEEK_CUR)
+    return None
+
+
+def quick_dimensions(source: Union[str, BinaryIO]) -> Tuple[int, int]:
+    if isinstance(source, str):
+        with open(source, "rb") as file:
+            return quick_dimensions(file)
+    dimensions = parse_header_dimensions(source)
+    if dimensions is None:
+        source.seek(0)
+        dimensions = read_dimensions(source)
+    return dimensions
+
+
+async def load_cached_response(cache_path: str) -> Optional[Dict[str, Any]]:
+    try:
+        async with aiofiles.open(cache_path, "rb") as file:
+            return orjson.loads(await file.read())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return None
+
+
+async def save_cached_response(
+    cache_path: str, response: aiohttp.ClientResponse, data: Dict[str, Any]
+) -> None:
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not (etag or last_modified):
+        return
+    cached = {"etag": etag, "last_modified": last_modified, "data": data}
+    async with aiofiles.open(cache_path, "wb") as file:
+        await file.write(orjson.dumps(cached))
+
+
 async def fetch_data(
     session: aiohttp.ClientSession,
     url: str,
     params: Dict[str, str] = None,
     logger: logging.Logger = None,
+    cache_path: Optional[str] = None,
 ) -> Dict[str, Any]:
-    async with session.get(url, params=params) as response:
-        if response.status == 200:
-            return await response.json()
-        else:
-            logger.warning(
-                f"Failed to fetch data from {url}, status code: {response.status}"
-            )
-            return {}
+    # Revalidate a previously cached response instead of downloading it again.
+    headers = {}
+    cached = await load_cached_response(cache_path) if cache_path else None
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            async with (
+                host_semaphore(url),
+                host_rate_limiter(url),
+                session.get(url, params=params, headers=headers) as response,
+            ):
+                if response.status == 200:
+                    data = await response.json(loads=orjson.loads)
+                    if cache_path:
+                        await save_cached_response(cache_path, response, data)
+                    return data
+                if response.status == 304 and cached:
+                    return cached["data"]
+                if (
+                    response.status not in RETRYABLE_STATUSES
+                    or attempt == MAX_ATTEMPTS - 1
+                ):
+                    logger.warning(
+                        f"Failed to fetch data from {url}, status code: {response.status}"
+                    )
+                    return {}
+                delay = retry_delay(attempt, response)
+        except TRANSIENT_ERRORS:
+            if attempt == MAX_ATTEMPTS - 1:
+                raise
+            delay = retry_delay(attempt)
+        logger.debug(f"Retrying {url} in {delay}s (attempt {attempt + 1})")
+        await asyncio.sleep(delay)
+
+
+async def read_image_response(
+    response: aiohttp.ClientResponse, local_path: Optional[str]
+) -> Tuple[int, int]:
+    if local_path:
+        # Stream into a temporary name so an interrupted download never
+        # leaves a truncated image behind for skip_existing to pick up.
+        partial_path = f"{local_path}.part"
+        try:
+            async with aiofiles.open(partial_path, "wb") as file:
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    await file.write(chunk)
+            # Only keep bodies that actually parse as an image.
+            dimensions = await asyncio.to_thread(quick_dimensions, partial_path)
+        except BaseException:
+            with suppress(OSError):
+                await aiofiles.os.remove(partial_path)
+            raise
+        await aiofiles.os.replace(partial_path, local_path)
+        return dimensions
+
+    # Only the dimensions are needed, so stop reading once the JPEG/PNG header
+    # has arrived. Other formats fall back to spooling the body for Pillow.
+    chunks = response.content.iter_chunked(CHUNK_SIZE)
+    head = bytearray()
+    async for chunk in chunks:
+        head += chunk
+        dimensions = parse_header_dimensions(BytesIO(head))
+        if dimensions:
+            return dimensions
+        if len(head) >= HEADER_PROBE_SIZE:
+            break
+
+    with SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as buffer:
+        await asyncio.to_thread(buffer.write, head)
+        async for chunk in chunks:
+            await asyncio.to_thread(buffer.write, chunk)
+        buffer.seek(0)
+        return await asyncio.to_thread(quick_dimensions, buffer)
 
 
-@retry(
-    stop=stop_after_attempt(5),
-    wait=wait_exponential(multiplier=1, min=1, max=60),
-    reraise=True,
-)
 async def fetch_image_details(
     session: aiohttp.ClientSession,
     url: str,
-    save_path: Optional[str],
-    skip_existing: bool,
+    local_path: Optional[str],
+    is_existing: bool,
+    cached_dimensions: Optional[List[int]],
     logger: logging.Logger,
 ) -> Dict[str, Any]:
-    local_path = None
-    if save_path:
-        local_path = os.path.join(save_path, os.path.basename(url))
-        if skip_existing and os.path.exists(local_path):
-            with Image.open(local_path) as image:
-                width, height = image.size
-                resolution = width * height
-            return {
-                "url": url,
-                "dimensions": (width, height),
-                "resolution": resolution,
-                "local_path": local_path,
-            }
-
-    try:
-        async with session.get(url) as response:
-            image = Image.open(BytesIO(await response.read()))
-            width, height = image.size  # returns (width, height)
+    if is_existing:
+        try:
+            dimensions = cached_dimensions
+            if dimensions is None:
+                dimensions = await asyncio.to_thread(quick_dimensions, local_path)
+            width, height = dimensions
             resolution = width * height
-            if save_path and not (skip_existing and os.path.exists(local_path)):
-                image.save(local_path)
             return {
                 "url": url,
                 "dimensions": (width, height),
                 "resolution": resolution,
                 "local_path": local_path,
             }
-    except Exception as e:
-        logger.error(f"Failed to fetch image details for URL {url}: {e}")
-        return {}
+        except OSError as e:
+            logger.warning(f"Re-downloading unreadable image {local_path}: {e}")
+
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            async with IMAGE_DOWNLOAD_SEMAPHORE, session.get(url) as response:
+                if response.status in RETRYABLE_STATUSES and attempt < MAX_ATTEMPTS - 1:
+                    delay = retry_delay(attempt, response)
+                else:
+                    response.raise_for_status()
+                    width, height = await read_image_response(response, local_path)
+                    resolution = width * height
+                    return {
+                        "url": url,
+                        "dimensions": (width, height),
+                        "resolution": resolution,
+                        "local_path": local_path,
+                    }
+        except TRANSIENT_ERRORS as e:
+            if attempt == MAX_ATTEMPTS - 1:
+                logger.error(f"Failed to fetch image details for URL {url}: {e}")
+                return {}
+            delay = retry_delay(attempt)
+        except Exception as e:
+            logger.error(f"Failed to fetch image details for URL {url}: {e}")
+            return {}
+        logger.debug(f"Retrying {url} in {delay}s (attempt {attempt + 1})")
+        await asyncio.sleep(delay)
+
+
+def start_progress_phase(progress_bar: tqdm, description: str, total: int) -> None:
+    progress_bar.total += total
+    if progress_bar.disable:
+        return
+    if progress_bar.desc != description:
+        progress_bar.set_description_str(description, refresh=False)
+    progress_bar.refresh()
 
 
 async def fetch_release_groups(
@@ -101,7 +398,7 @@ async def fetch_release_groups(
             params=params,
             logger=logger,
         )
-    except RetryError as e:
+    except TRANSIENT_ERRORS as e:
         logger.error(f"Failed to fetch release groups after retries: {e}")
         return {}
 
@@ -113,72 +410,85 @@ async def get_release_groups(
     logger: logging.Logger,
     progress_bar,
 ) -> List[Dict[str, Any]]:
-    release_groups = []
     limit = 100
 
+    def update_progress(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is None:
+            progress_bar.update(len(task.result().get("release-groups", [])))
+
     initial_data = await fetch_release_groups(session, artist, album, 0, limit, logger)
     total_count = initial_data.get("count", 0)
-    release_groups.extend(initial_data.get("release-groups", []))
-
-    tasks = [
-        fetch_release_groups(session, artist, album, offset, limit, logger)
-        for offset in range(limit, total_count, limit)
-    ]
-    results = []
+    release_groups = initial_data.get("release-groups", [])
 
-    progress_bar.total = total_count
-    progress_bar.refresh()
+    start_progress_phase(progress_bar, "Fetching release groups", total_count)
+    progress_bar.update(len(release_groups))
 
-    progress_bar.set_description(f"Fetching release groups for {artist} - {album}")
-    for task in tqdm.as_completed(tasks):
-        result = await task
-        results.append(result)
-        progress_bar.update(len(result.get("release-groups", [])))
-
-    for result in results:
-        release_groups.extend(result.get("release-groups", []))
+    async with asyncio.TaskGroup() as task_group:
+        tasks = [
+            task_group.create_task(
+                fetch_release_groups(session, artist, album, offset, limit, logger)
+            )
+            for offset in range(limit, total_count, limit)
+        ]
+        for task in tasks:
+            task.add_done_callback(update_progress)
 
+    release_groups.extend(
+        chain.from_iterable(task.result().get("release-groups", []) for task in tasks)
+    )
     return release_groups
 
 
 async def fetch_cover_art_urls(
-    session: aiohttp.ClientSession, release_id: str, logger: logging.Logger
+    session: aiohttp.ClientSession,
+    release_id: str,
+    cache_dir: str,
+    logger: logging.Logger,
 ) -> Tuple[str, List[str]]:
+    if release_id in COVER_ART_URL_CACHE:
+        return release_id, COVER_ART_URL_CACHE[release_id]
+
     url = f"https://coverartarchive.org/release/{release_id}"
     try:
-        data = await fetch_data(session, url, logger=logger)
-        images = data.get("images", [])
+        data = await fetch_data(
+            session,
+            url,
+            logger=logger,
+            cache_path=os.path.join(cache_dir, f"{release_id}.json"),
+        )
         urls = [
-            image["image"]
-            for image in images
-            if "image" in image and image.get("types") and "Front" in image["types"]
+            image_url
+            for image in data.get("images", ())
+            if "Front" in (image.get("types") or ())
+            and (image_url := image.get("image"))
         ]
+        if data:
+            COVER_ART_URL_CACHE[release_id] = urls
         return release_id, urls
-    except RetryError:
+    except TRANSIENT_ERRORS as e:
+        logger.error(f"Failed to fetch cover art URLs for {release_id}: {e}")
         return release_id, []
 
 
 async def get_cover_art_urls(
     session: aiohttp.ClientSession,
     release_ids: List[str],
-    artist: str,
-    album: str,
+    cache_dir: str,
     logger: logging.Logger,
     progress_bar,
 ) -> List[Tuple[str, List[str]]]:
-    tasks = [
-        fetch_cover_art_urls(session, release_id, logger) for release_id in release_ids
-    ]
-    results = []
-
-    progress_bar.total = len(tasks)
-    progress_bar.set_description(f"Fetching cover art URLs for {artist} - {album}")
-    for task in tqdm.as_completed(tasks):
-        result = await task
-        results.append(result)
-        progress_bar.update(1)
+    start_progress_phase(progress_bar, "Fetching cover art URLs", len(release_ids))
+    async with asyncio.TaskGroup() as task_group:
+        tasks = [
+            task_group.create_task(
+                fetch_cover_art_urls(session, release_id, cache_dir, logger)
+            )
+            for release_id in release_ids
+        ]
+        for task in tasks:
+            task.add_done_callback(lambda _: progress_bar.update(1))
 
-    return results
+    return [task.result() for task in tasks]
 
 
 async def find_image_details(
@@ -190,30 +500,57 @@ async def find_image_details(
     logger: logging.Logger,
     progress_bar,
 ) -> List[Dict[str, Any]]:
-    tasks = [
-        fetch_image_details(session, url, save_path, skip_existing, logger)
-        for url in urls
-    ]
-    image_details = []
-
-    progress_bar.total = len(tasks)
-    progress_bar.set_description(desc)
-    for task in tqdm.as_completed(tasks):
-        result = await task
-        image_details.append(result)
-        progress_bar.update(1)
-
-    valid_image_details = [detail for detail in image_details if detail]
-    sorted_details = sorted(
-        valid_image_details, key=lambda x: x["resolution"], reverse=True
-    )
-    return sorted_details
-
+    existing_files = {}
+    dimensions_cache = {}
+    if save_path:
+        dimensions_cache = await asyncio.to_thread(load_dimensions_cache, save_path)
+        if skip_existing:
+            existing_files = await asyncio.to_thread(scan_directory, save_path)
+
+    # Resolve file names and local paths once up front rather than per task.
+    targets = [(url, url.rsplit("/", 1)[-1]) for url in urls]
+    path_prefix = os.path.join(save_path, "") if save_path else None
+
+    start_progress_phase(progress_bar, desc, len(urls))
+    async with asyncio.TaskGroup() as task_group:
+        tasks = [
+            task_group.create_task(
+                fetch_image_details(
+                    session,
+                    url,
+                    path_prefix + filename if path_prefix else None,
+                    filename in existing_files,
+                    lookup_cached_dimensions(
+                        dimensions_cache, filename, existing_files.get(filename)
+                    ),
+                    logger,
+                )
+            )
+            for url, filename in targets
+        ]
+        for task in tasks:
+            task.add_done_callback(lambda _: progress_bar.update(1))
 
-def save_output_to_file(data: Any, filepath: str, logger: logging.Logger) -> str:
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    with open(filepath, "w") as file:
-        json.dump(data, file, indent=4)
+    valid_image_details = [task.result() for task in tasks if task.result()]
+    if save_path:
+        current_files = await asyncio.to_thread(scan_directory, save_path)
+        for (_, filename), task in zip(targets, tasks):
+            signature = current_files.get(filename)
+            if task.result() and signature:
+                size, mtime_ns = signature
+                dimensions_cache[filename] = {
+                    "dimensions": list(task.result()["dimensions"]),
+                    "size": size,
+                    "mtime_ns": mtime_ns,
+                }
+        await asyncio.to_thread(save_dimensions_cache, save_path, dimensions_cache)
+    return valid_image_details
+
+
+async def save_output_to_file(data: Any, filepath: str, logger: logging.Logger) -> str:
+    await asyncio.to_thread(os.makedirs, os.path.dirname(filepath), exist_ok=True)
+    async with aiofiles.open(filepath, "wb") as file:
+        await file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     logger.info(f"Output saved to {filepath}")
     return filepath
 
@@ -243,18 +580,25 @@ async def process_artist_album(
         )
         return {}
 
-    release_ids = [
-        release["id"]
-        for release_group in release_groups
-        for release in release_group.get("releases", [])
-        if not status or release.get("status") == status
-    ]
+    release_ids = list(
+        dict.fromkeys(
+            release["id"]
+            for release_group in release_groups
+            for release in release_group.get("releases", ())
+            if not status or release.get("status") == status
+        )
+    )
 
+    cache_dir = os.path.join(output_dir, CAA_CACHE_DIRNAME)
+    await asyncio.to_thread(os.makedirs, cache_dir, exist_ok=True)
     cover_art_results = await get_cover_art_urls(
-        session, release_ids, artist, album, logger, progress_bar
+        session, release_ids, cache_dir, logger, progress_bar
     )
 
-    all_cover_art_urls = [url for _, urls in cover_art_results for url in urls]
+    # Releases within a release group frequently share the same front cover.
+    all_cover_art_urls = list(
+        dict.fromkeys(url for _, urls in cover_art_results for url in urls)
+    )
 
     if not all_cover_art_urls:
         logger.error(f"No cover art found for {artist} - {album}.")
@@ -263,15 +607,15 @@ async def process_artist_album(
     # Create directories for the artist and album
     artist_dir = os.path.join(output_dir, artist)
     album_dir = os.path.join(artist_dir, album)
-    os.makedirs(album_dir, exist_ok=True)
+    await asyncio.to_thread(os.makedirs, album_dir, exist_ok=True)
 
     save_path = album_dir if save_images else None
-    sorted_image_details = await find_image_details(
+    image_details = await find_image_details(
         session,
         all_cover_art_urls,
         save_path,
         skip_existing,
-        desc=f"Downloading images for {artist} - {album}",
+        desc="Downloading images",
         logger=logger,
         progress_bar=progress_bar,
     )
@@ -282,11 +626,29 @@ async def process_artist_album(
         "album": album,
         "release_type": release_type,
         "status": status,
-        "cover_art_images": sorted_image_details,
+        "cover_art_images": sorted(
+            image_details, key=itemgetter("resolution"), reverse=True
+        ),
     }
-    save_output_to_file(metadata, os.path.join(album_dir, f"{album}.json"), logger)
+    await save_output_to_file(
+        metadata, os.path.join(album_dir, f"{album}.json"), logger
+    )
 
-    return sorted_image_details[0] if sorted_image_details else {}
+    return max(image_details, key=itemgetter("resolution"), default={})
+
+
+async def warm_dns_cache(
+    connector: aiohttp.TCPConnector, logger: logging.Logger
+) -> None:
+    # aiohttp has no public API to seed its DNS cache; resolving through the
+    # connector stores the results the same way a first request would.
+    results = await asyncio.gather(
+        *(connector._resolve_host(host, port) for host, port in PRERESOLVED_HOSTS),
+        return_exceptions=True,
+    )
+    for (host, port), result in zip(PRERESOLVED_HOSTS, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Failed to pre-resolve {host}:{port}: {result}")
 
 
 async def main(
@@ -299,15 +661,28 @@ async def main(
     output_dir = config.get("output_dir", ".")
     skip_existing = config.get("skip_existing", True)
 
-    async with aiohttp.ClientSession() as session:
+    # Keep TLS connections to MusicBrainz/CAA alive between bursts of requests.
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=CONNECTIONS_PER_HOST,
+        resolver=aiohttp.AsyncResolver(),
+        use_dns_cache=True,
+        ttl_dns_cache=3600,
+        keepalive_timeout=75,
+        # CPython 3.12.7+ fixed the SSL transport leak this works around, and
+        # aiohttp ignores the flag there with a DeprecationWarning.
+        enable_cleanup_closed=sys.version_info < (3, 12, 7),
+    )
+    await warm_dns_cache(connector, logger)
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=30)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
         highest_res_images = []
         tasks = []
+        # One bar shared by every album; each phase adds its work to the total.
+        progress_bar = tqdm(total=0, unit="task", mininterval=0.2, disable=None)
         for artist_album in artists_albums:
             artist = artist_album["artist"]
             for album in artist_album["albums"]:
-                progress_bar = tqdm(
-                    total=1, desc=f"Processing {artist} - {album}", unit="task"
-                )
                 task = process_artist_album(
                     session,
                     artist,
@@ -322,7 +697,8 @@ async def main(
                 )
                 tasks.append(task)
 
-        results = await asyncio.gather(*tasks)
+        with progress_bar:
+            results = await asyncio.gather(*tasks)
 
         for highest_res_image, artist_album in zip(results, artists_albums):
             artist = artist_album["artist"]
@@ -342,14 +718,13 @@ async def main(
             final_filename = os.path.join(
                 artist_dir, f"highest_resolution_images_{timestamp}.json"
             )
-            save_output_to_file(highest_res_images, final_filename, logger)
+            await save_output_to_file(highest_res_images, final_filename, logger)
 
         # Save config to a JSON file in the top-level directory if not loaded from a config file
         if should_save_config:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             config_filename = os.path.join(output_dir, f"config_{timestamp}.json")
-            with open(config_filename, "w") as file:
-                json.dump(config, file, indent=4)
+            await save_output_to_file(config, config_filename, logger)
 
 
 if __name__ == "__main__":
@@ -381,11 +756,11 @@ if __name__ == "__main__":
     config_loaded_from_file = False
 
     if args.config_file:
-        with open(args.config_file, "r") as file:
-            config = json.load(file)
+        with open(args.config_file, "rb") as file:
+            config = orjson.loads(file.read())
             config_loaded_from_file = True
     elif args.config_json:
-        config = json.loads(args.config_json)
+        config = orjson.loads(args.config_json)
         config_loaded_from_file = True
     else:
         config = {}
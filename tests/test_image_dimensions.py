@@ -0,0 +1,74 @@
+import io
+import struct
+
+import pytest
+from PIL import Image
+
+from cover_art_hunter import parse_header_dimensions, quick_dimensions
+
+
+def encode(size, fmt, **params):
+    buffer = io.BytesIO()
+    Image.new("RGB", size).save(buffer, fmt, **params)
+    return buffer.getvalue()
+
+
+def exif_bytes():
+    exif = Image.Exif()
+    exif[0x010E] = "x" * 4096  # ImageDescription, forces a large APP1 segment
+    return exif.tobytes()
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (encode((640, 480), "JPEG"), (640, 480)),
+        (encode((333, 777), "JPEG", progressive=True), (333, 777)),
+        (encode((100, 50), "JPEG", exif=exif_bytes()), (100, 50)),
+        (encode((1200, 1100), "PNG"), (1200, 1100)),
+    ],
+    ids=["jpeg-baseline", "jpeg-progressive", "jpeg-exif", "png"],
+)
+def test_parses_jpeg_and_png_headers(data, expected):
+    assert parse_header_dimensions(io.BytesIO(data)) == expected
+    assert quick_dimensions(io.BytesIO(data)) == expected
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        encode((640, 480), "PNG")[:20],
+        encode((640, 480), "JPEG")[:40],
+        b"\xff\xd8\xff\xe0\x00\x00",  # zero segment length
+        b"\xff\xd8" + b"\xff" * 64,
+        b"<html>Not an image</html>",
+        b"",
+    ],
+    ids=[
+        "truncated-png",
+        "truncated-jpeg",
+        "bad-segment-length",
+        "fill-bytes",
+        "html",
+        "empty",
+    ],
+)
+def test_returns_none_for_unparseable_headers(data):
+    assert parse_header_dimensions(io.BytesIO(data)) is None
+
+
+def test_falls_back_to_pillow_for_other_formats():
+    assert quick_dimensions(io.BytesIO(encode((31, 17), "GIF"))) == (31, 17)
+
+
+def test_unreadable_image_raises_oserror(tmp_path):
+    path = tmp_path / "cover.png"
+    path.write_bytes(encode((640, 480), "PNG")[:20])
+    with pytest.raises(OSError):
+        quick_dimensions(str(path))
+
+
+def test_png_with_zero_dimensions_is_not_trusted():
+    data = encode((8, 8), "PNG")
+    data = data[:16] + struct.pack(">II", 0, 0) + data[24:]
+    assert parse_header_dimensions(io.BytesIO(data)) is None